@@ -7,15 +7,33 @@ data/Crimes_-_2001_to_Present_20251124.csv.
 
 from __future__ import annotations
 
+import heapq
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import networkx as nx
-from sklearn.cluster import DBSCAN
-from sklearn.neighbors import BallTree
+import polars as pl
+import pyarrow as pa
+import igraph as ig
+from dbscan import DBSCAN
+from numba import njit, prange
+
+try:
+    import networkit as nk
+except ImportError:
+    nk = None
+else:
+    # Once per process, capped at the CPUs this process may run on (os.cpu_count
+    # ignores affinity); elsewhere keep OpenMP's default.
+    if hasattr(os, "sched_getaffinity"):
+        nk.setNumberOfThreads(len(os.sched_getaffinity(0)))
+
+try:  # optional: graph-tool ships via conda/system packages, not pip
+    import graph_tool.all as gt
+except ImportError:
+    gt = None
 
 
 @dataclass
@@ -26,25 +44,232 @@ class Config:
     dbscan_min_samples: int = 5
 
 
-def load_data(path: str) -> pd.DataFrame:
-    """Load the dataset, parse dates, and drop rows without coordinates."""
+# Above this many nodes, exact Brandes is swapped for NetworKit's
+# EstimateBetweenness: one SSSP per sampled source, O(samples * m). It has no
+# formal epsilon bound (ApproxBetweenness trades speed for one), so nodes with
+# close scores can swap in or out of the top 15 relative to the exact ranking.
+# The sampler is seeded so every process reports the same estimate.
+APPROX_BETWEENNESS_NODES = 2000
+APPROX_BETWEENNESS_SAMPLES = 1500
+APPROX_BETWEENNESS_SEED = 42
+
+EARTH_RADIUS_MILES = 3959
+
+
+def _project(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Equirectangular (x, y) miles around the points' mean latitude.
+
+    Over a city-sized extent Euclidean distance on this plane is within ~0.1%
+    of haversine, so radius searches can skip the trig.
+    """
+    lat = np.deg2rad(np.asarray(lat, dtype=np.float64))
+    lon = np.deg2rad(np.asarray(lon, dtype=np.float64))
+    x = EARTH_RADIUS_MILES * lon * (np.cos(lat.mean()) if len(lat) else 1.0)
+    y = EARTH_RADIUS_MILES * lat
+    return np.column_stack((x, y))
+
+
+@njit(cache=True)
+def _neighbor_ranges(cells, bounds, ncols):
+    """For each occupied cell, the [lo, hi) sorted-point ranges of its 3x3 block."""
+    ranges = np.zeros((len(cells), 9, 2), np.int64)
+    for c in range(len(cells)):
+        t = 0
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                cell = cells[c] + dx * ncols + dy
+                k = np.searchsorted(cells, cell)
+                if k < len(cells) and cells[k] == cell:
+                    ranges[c, t, 0] = bounds[k]
+                    ranges[c, t, 1] = bounds[k + 1]
+                t += 1
+    return ranges
+
+
+@njit(parallel=True, cache=True)
+def _grid_pair_counts(xs, ys, ds, r2, max_days, order, bounds, ranges):
+    """Per cell, how many of its points' pairs fall within both r and max_days."""
+    counts = np.zeros(len(bounds) - 1, np.int64)
+    for c in prange(len(bounds) - 1):
+        for p in range(bounds[c], bounds[c + 1]):
+            for t in range(9):
+                for q in range(ranges[c, t, 0], ranges[c, t, 1]):
+                    if (
+                        order[p] < order[q]
+                        and abs(ds[p] - ds[q]) <= max_days
+                        and (xs[p] - xs[q]) ** 2 + (ys[p] - ys[q]) ** 2 <= r2
+                    ):
+                        counts[c] += 1
+    return counts
+
+
+@njit(parallel=True, cache=True)
+def _grid_pair_fill(xs, ys, ds, r2, max_days, order, bounds, ranges, offsets):
+    """Write the pairs _grid_pair_counts counted, each cell from its offset."""
+    I = np.empty(offsets[-1], np.int32)
+    J = np.empty(offsets[-1], np.int32)
+    D = np.empty(offsets[-1], np.float64)
+    for c in prange(len(bounds) - 1):
+        k = offsets[c]
+        for p in range(bounds[c], bounds[c + 1]):
+            for t in range(9):
+                for q in range(ranges[c, t, 0], ranges[c, t, 1]):
+                    if order[p] >= order[q] or abs(ds[p] - ds[q]) > max_days:
+                        continue
+                    d2 = (xs[p] - xs[q]) ** 2 + (ys[p] - ys[q]) ** 2
+                    if d2 <= r2:
+                        I[k] = order[p]
+                        J[k] = order[q]
+                        D[k] = np.sqrt(d2)
+                        k += 1
+    return I, J, D
+
+
+def _spatiotemporal_pairs(
+    xy: np.ndarray, r: float, days: np.ndarray, max_days: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pairs (i < j) within distance ``r`` and ``max_days`` days, as (I, J, D) arrays.
+
+    Points are hashed into r-sized grid cells and sorted by cell, so each cell
+    is only compared with the 3x3 block around it. Both limits are tested in
+    the kernels, and a counting pass sizes the output exactly before the fill
+    pass writes it, so pairs outside the time window are never stored.
+    """
+    x, y = xy[:, 0], xy[:, 1]
+    cx = ((x - x.min()) // r).astype(np.int64) + 1
+    cy = ((y - y.min()) // r).astype(np.int64) + 1
+    ncols = int(cy.max()) + 2  # row stride; the +1 margins keep dy = +-1 in-row
+    key = cx * ncols + cy
+    order = np.argsort(key, kind="stable")
+    cells, starts = np.unique(key[order], return_index=True)
+    bounds = np.append(starts, len(x))
+    ranges = _neighbor_ranges(cells, bounds, ncols)
+    xs, ys, ds = x[order], y[order], days[order]
+
+    counts = _grid_pair_counts(xs, ys, ds, r * r, max_days, order, bounds, ranges)
+    offsets = np.zeros(len(cells) + 1, np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return _grid_pair_fill(xs, ys, ds, r * r, max_days, order, bounds, ranges, offsets)
+
+
+# Compile at import so the first request doesn't pay the JIT cost.
+_spatiotemporal_pairs(np.zeros((2, 2)), 1.0, np.zeros(2, np.int64), 0)
+
+
+# Columns the analytics read; the rest of the CPD extract is never loaded.
+COLUMNS = [
+    "Case Number",
+    "Date",
+    "Block",
+    "Primary Type",
+    "Description",
+    "Arrest",
+    "Domestic",
+    "Latitude",
+    "Longitude",
+]
+
+
+CPD_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
+
+def _scan_csv(path: str) -> pl.LazyFrame:
+    date = pl.col("Date")
+    return (
+        pl.scan_csv(path, schema_overrides={"Date": pl.Utf8, "Arrest": pl.Utf8, "Domestic": pl.Utf8})
+        .select(COLUMNS)
+        .with_columns(
+            # Prefer explicit CPD format; fall back to auto if needed.
+            pl.coalesce(
+                date.str.strptime(pl.Datetime("ns"), CPD_DATE_FORMAT, strict=False),
+                date.str.to_datetime(time_unit="ns", strict=False),
+            ),
+            pl.col("Arrest", "Domestic").str.to_lowercase() == "true",
+            pl.col("Latitude", "Longitude").cast(pl.Float64, strict=False),
+        )
+        .drop_nulls(["Date", "Latitude", "Longitude"])
+    )
+
+
+def _is_fresh(derived_path: str, path: str) -> bool:
+    return os.path.exists(derived_path) and os.path.getmtime(derived_path) >= os.path.getmtime(path)
+
+
+def _source_stamp(path: str) -> Dict[bytes, bytes]:
+    """Identity of the CSV a shared file was built from, for its schema metadata."""
+    st = os.stat(path)
+    return {
+        b"source_path": os.path.abspath(path).encode(),
+        b"source_size": str(st.st_size).encode(),
+        b"source_mtime_ns": str(st.st_mtime_ns).encode(),
+    }
+
+
+def load_data(path: str, shared_path: Optional[str] = None) -> pd.DataFrame:
+    """Load the dataset, parse dates, and drop rows without coordinates.
+
+    ``shared_path`` optionally names an Arrow IPC file from export_shared.
+    """
     if not os.path.exists(path):
         raise FileNotFoundError(f"CSV not found at {path}")
 
-    df = pd.read_csv(path, low_memory=False)
-    # Prefer explicit CPD format; fall back to auto if needed.
-    df["Date"] = pd.to_datetime(df["Date"], format="%m/%d/%Y %I:%M:%S %p", errors="coerce")
-    if df["Date"].isna().any():
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df = df.dropna(subset=["Date", "Latitude", "Longitude"])
+    # Map the shared file when it was built from this CSV, so worker processes
+    # share its numeric and categorical buffers rather than each holding a copy.
+    if shared_path and os.path.exists(shared_path):
+        reader = pa.ipc.open_file(pa.memory_map(shared_path))
+        metadata = reader.schema.metadata or {}
+        if all(metadata.get(k) == v for k, v in _source_stamp(path).items()):
+            return reader.read_all().to_pandas(split_blocks=True)
 
-    df["Year"] = df["Date"].dt.year
+    # Parsed rows are cached next to the CSV; while newer than it, restarts
+    # skip CSV and datetime parsing.
+    cache_path = f"{path}.parquet"
+    if _is_fresh(cache_path, path):
+        lf = pl.scan_parquet(cache_path).select(COLUMNS)
+    else:
+        parsed = _scan_csv(path).collect()
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            parsed.write_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only data dir: serve without the cache.
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        lf = parsed.lazy()
+
+    # Narrow dtypes halve the bytes every downstream scan touches. float32 keeps
+    # ~1 m of coordinate precision; _project widens back to float64. Repeated
+    # labels become categoricals so filters and groupbys work on integer codes.
+    date = pl.col("Date")
+    df = lf.with_columns(
+        pl.col("Latitude", "Longitude").cast(pl.Float32),
+        pl.col("Arrest", "Domestic").cast(pl.Boolean),
+        pl.col("Primary Type", "Description", "Block").cast(pl.Categorical),
+        date.dt.year().cast(pl.Int16).alias("Year"),
+        date.dt.strftime("%A").cast(pl.Categorical).alias("Dow"),
+        date.dt.hour().cast(pl.Int8).alias("Hour"),
+        # Calendar days since the epoch, for the graph's temporal window.
+        date.dt.epoch("d").cast(pl.Int64).alias("date_days"),
+    ).collect().to_pandas()
     df["Month"] = df["Date"].dt.to_period("M")
-    df["Dow"] = df["Date"].dt.day_name()
-    df["Hour"] = df["Date"].dt.hour
     return df
 
 
+def export_shared(df: pd.DataFrame, path: str, shared_path: str) -> None:
+    """Write a frame loaded from ``path`` as an uncompressed Arrow IPC file for load_data to map."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_source_stamp(path)})
+    tmp_path = f"{shared_path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, shared_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def overall_summary(df: pd.DataFrame) -> Dict:
     top_types = df["Primary Type"].value_counts().head(7)
     return {
@@ -61,7 +286,7 @@ def overall_summary(df: pd.DataFrame) -> Dict:
 def temporal_profiles(df: pd.DataFrame) -> Dict:
     monthly = df.groupby("Month").size().sort_index().tail(12)
     hourly = df.groupby("Hour").size().sort_index()
-    dow = df.groupby("Dow").size().sort_values(ascending=False)
+    dow = df.groupby("Dow", observed=True).size().sort_values(ascending=False)
     return {
         "monthly_tail": {str(k): int(v) for k, v in monthly.astype(int).to_dict().items()},
         "hourly": {int(k): int(v) for k, v in hourly.astype(int).to_dict().items()},
@@ -69,16 +294,30 @@ def temporal_profiles(df: pd.DataFrame) -> Dict:
     }
 
 
-def dbscan_hotspots(df: pd.DataFrame, crime_type: str, cfg: Config) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    subset = df[df["Primary Type"] == crime_type].copy()
-    if subset.empty:
-        return subset.assign(cluster=-1), pd.DataFrame()
+def type_index(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Positional row indices per Primary Type, computed in one groupby pass."""
+    return df.groupby("Primary Type", observed=True).indices
+
+
+def project_coords(df: pd.DataFrame, idx: np.ndarray) -> np.ndarray:
+    """Projected (x, y) miles of the rows at positions ``idx``."""
+    return _project(df["Latitude"].values[idx], df["Longitude"].values[idx])
+
+
+def dbscan_hotspots(
+    df: pd.DataFrame, idx: np.ndarray, cfg: Config, xy: Optional[np.ndarray] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """DBSCAN over the rows at positions ``idx`` (one crime type, see type_index).
 
-    coords = np.deg2rad(subset[["Latitude", "Longitude"]].values)
-    eps_rad = cfg.dbscan_eps_miles / 3959
-    model = DBSCAN(eps=eps_rad, min_samples=cfg.dbscan_min_samples, metric="haversine")
-    labels = model.fit_predict(coords)
-    subset["cluster"] = labels
+    ``xy`` may pass in project_coords(df, idx) already computed by the caller.
+    """
+    if len(idx) == 0:
+        return df.iloc[:0].assign(cluster=-1), pd.DataFrame()
+
+    if xy is None:
+        xy = project_coords(df, idx)
+    labels, _ = DBSCAN(xy, eps=cfg.dbscan_eps_miles, min_samples=cfg.dbscan_min_samples)
+    subset = df.take(idx).assign(cluster=labels)
 
     agg_rows = []
     for cid, group in subset[subset["cluster"] >= 0].groupby("cluster"):
@@ -96,84 +335,163 @@ def dbscan_hotspots(df: pd.DataFrame, crime_type: str, cfg: Config) -> Tuple[pd.
     return subset, clusters
 
 
-def build_spatiotemporal_graph(df: pd.DataFrame, crime_type: str, cfg: Config) -> nx.Graph:
-    subset = df[df["Primary Type"] == crime_type].copy()
-    subset = subset.reset_index(drop=True)
-    if subset.empty:
-        return nx.Graph()
-
-    coords_rad = np.deg2rad(subset[["Latitude", "Longitude"]].values)
-    tree = BallTree(coords_rad, metric="haversine")
-    radius = cfg.spatial_radius_miles / 3959
-    neighbors, distances = tree.query_radius(coords_rad, r=radius, return_distance=True, sort_results=True)
-
-    G = nx.Graph()
-    for _, row in subset.iterrows():
-        G.add_node(
-            row["Case Number"],
-            date=row["Date"],
-            lat=row["Latitude"],
-            lon=row["Longitude"],
-            block=row["Block"],
-            description=row["Description"],
-            arrest=bool(row["Arrest"]),
-        )
+def build_spatiotemporal_graph(
+    df: pd.DataFrame, idx: np.ndarray, cfg: Config, xy: Optional[np.ndarray] = None
+) -> ig.Graph:
+    """Incident graph over the rows at positions ``idx`` (one crime type, see type_index).
 
-    for i, (idxs, dists) in enumerate(zip(neighbors, distances)):
-        case_a = subset.iloc[i]
-        for j, dist in zip(idxs, dists):
-            if i >= j:
-                continue
-            case_b = subset.iloc[j]
-            dt_days = abs((case_a["Date"] - case_b["Date"]).days)
-            if dt_days <= cfg.temporal_days:
-                G.add_edge(
-                    case_a["Case Number"],
-                    case_b["Case Number"],
-                    distance_miles=dist * 3959,
-                    time_diff_days=dt_days,
-                    weight=1 / (dt_days if dt_days > 0 else 1),
-                )
-    return G
-
-
-def component_summary(G: nx.Graph) -> List[Dict]:
-    comps = list(nx.connected_components(G))
-    rows = []
-    for comp in comps:
-        sub = G.subgraph(comp)
-        lats = [d["lat"] for _, d in sub.nodes(data=True)]
-        lons = [d["lon"] for _, d in sub.nodes(data=True)]
-        dates = [d["date"] for _, d in sub.nodes(data=True)]
-        arrests = [d["arrest"] for _, d in sub.nodes(data=True)]
-        rows.append(
-            {
-                "size": int(sub.number_of_nodes()),
-                "edges": int(sub.number_of_edges()),
-                "date_min": str(min(dates).date()),
-                "date_max": str(max(dates).date()),
-                "lat_center": float(np.mean(lats)),
-                "lon_center": float(np.mean(lons)),
-                "arrest_rate": float(np.mean(arrests)),
-            }
-        )
+    ``xy`` may pass in project_coords(df, idx) already computed by the caller.
+    """
+    if len(idx) == 0:
+        return ig.Graph()
+    subset = df.take(idx).reset_index(drop=True)
+
+    if xy is None:
+        xy = project_coords(df, idx)
+    days = df["date_days"].values[idx]
+    I, J, D = _spatiotemporal_pairs(xy, cfg.spatial_radius_miles, days, cfg.temporal_days)
+    dt_days = np.abs(days[I] - days[J])
+
+    # Rows sharing a Case Number collapse into one vertex (last row's attributes
+    # win). Vertices are numbered 0..n-1 in first-seen order, and per-vertex
+    # values the summaries reduce over also live as arrays in graph attributes.
+    node_of_row, cases = pd.factorize(subset["Case Number"])
+    _, first_from_end = np.unique(node_of_row[::-1], return_index=True)
+    last_row = len(subset) - 1 - first_from_end
+    nodes = subset.iloc[last_row]
+    n = len(cases)
+
+    # Row pairs can map to the same vertex pair; keep one simple edge each (the
+    # last pair's attributes, as repeated add_edge calls did).
+    u, v = node_of_row[I], node_of_row[J]
+    u, v = np.minimum(u, v), np.maximum(u, v)
+    _, first_from_end = np.unique((u * n + v)[::-1], return_index=True)
+    keep = len(u) - 1 - first_from_end
+
+    g = ig.Graph(n=n, edges=np.column_stack((u[keep], v[keep])).tolist(), directed=False)
+    g["lat"] = nodes["Latitude"].to_numpy(dtype=np.float64)
+    g["lon"] = nodes["Longitude"].to_numpy(dtype=np.float64)
+    g["date_ns"] = nodes["Date"].values.view("i8")
+    g["arrest"] = nodes["Arrest"].to_numpy(dtype=bool)
+    g.vs["case_number"] = cases.tolist()
+    g.vs["date"] = nodes["Date"].tolist()
+    g.vs["lat"] = g["lat"].tolist()
+    g.vs["lon"] = g["lon"].tolist()
+    g.vs["block"] = nodes["Block"].tolist()
+    g.vs["description"] = nodes["Description"].tolist()
+    g.vs["arrest"] = g["arrest"].tolist()
+    g.es["distance_miles"] = D[keep].tolist()
+    g.es["time_diff_days"] = dt_days[keep].tolist()
+    g.es["weight"] = (1 / np.maximum(dt_days[keep], 1)).tolist()
+    return g
+
+
+def component_summary(G: ig.Graph) -> List[Dict]:
+    """Per-component size/date/centroid/arrest stats from the graph's vertex arrays."""
+    n = G.vcount()
+    if n == 0:
+        return []
+
+    comp_id = np.asarray(G.connected_components().membership, dtype=np.int64)
+    k = int(comp_id.max()) + 1
+    edge_src = np.asarray(G.get_edgelist(), dtype=np.int64).reshape(-1, 2)[:, 0]
+    edges = np.bincount(comp_id[edge_src], minlength=k)
+
+    order = np.argsort(comp_id, kind="stable")
+    starts = np.searchsorted(comp_id[order], np.arange(k))
+    sizes = np.diff(np.append(starts, n))
+
+    lat = np.add.reduceat(G["lat"][order], starts) / sizes
+    lon = np.add.reduceat(G["lon"][order], starts) / sizes
+    arrest = np.add.reduceat(G["arrest"][order].astype(np.float64), starts) / sizes
+    date_ns = G["date_ns"][order].astype("datetime64[ns]")
+    date_min = np.datetime_as_string(np.minimum.reduceat(date_ns, starts), unit="D")
+    date_max = np.datetime_as_string(np.maximum.reduceat(date_ns, starts), unit="D")
+
+    rows = [
+        {
+            "size": int(sizes[c]),
+            "edges": int(edges[c]),
+            "date_min": str(date_min[c]),
+            "date_max": str(date_max[c]),
+            "lat_center": float(lat[c]),
+            "lon_center": float(lon[c]),
+            "arrest_rate": float(arrest[c]),
+        }
+        for c in range(k)
+    ]
     rows = sorted(rows, key=lambda r: r["size"], reverse=True)
     return rows
 
 
-def centrality(G: nx.Graph) -> List[Dict]:
-    if G.number_of_nodes() == 0:
+def _edge_array(G: ig.Graph) -> np.ndarray:
+    return np.asarray(G.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+
+
+def _betweenness_networkit(G: ig.Graph, approx: bool) -> np.ndarray:
+    src, dst = _edge_array(G).T.copy()  # addEdges wants contiguous arrays
+    nkG = nk.Graph(G.vcount())
+    nkG.addEdges((src, dst))
+    if approx:
+        nk.setSeed(APPROX_BETWEENNESS_SEED, True)
+        algo = nk.centrality.EstimateBetweenness(
+            nkG, APPROX_BETWEENNESS_SAMPLES, normalized=True, parallel=True
+        )
+    else:
+        algo = nk.centrality.Betweenness(nkG, normalized=True)
+    return np.asarray(algo.run().scores())
+
+
+def _betweenness_graph_tool(G: ig.Graph) -> np.ndarray:
+    g = gt.Graph(directed=False)
+    g.add_vertex(G.vcount())
+    g.add_edge_list(_edge_array(G))
+    vp, _ = gt.betweenness(g)  # normalized by 2 / ((n - 1)(n - 2))
+    return np.asarray(vp.a)
+
+
+def _betweenness(G: ig.Graph) -> np.ndarray:
+    """Normalized betweenness per vertex id.
+
+    Large graphs use NetworKit's sampling estimate. Otherwise exact Brandes
+    runs on graph-tool (Boost C++/OpenMP) when it is installed, else on
+    NetworKit's parallel implementation, else on igraph's C implementation.
+    """
+    n = G.vcount()
+    if n <= 2:
+        # No vertex can lie between two others; normalizing would divide by zero.
+        return np.zeros(n)
+    if nk is not None and n > APPROX_BETWEENNESS_NODES:
+        return _betweenness_networkit(G, approx=True)
+    if gt is not None:
+        return _betweenness_graph_tool(G)
+    if nk is not None:
+        return _betweenness_networkit(G, approx=False)
+    # igraph counts each unordered pair once; rescale to networkx's normalization.
+    return np.asarray(G.betweenness(directed=False)) * (2.0 / ((n - 1) * (n - 2)))
+
+
+def centrality(G: ig.Graph, top: Optional[int] = None) -> List[Dict]:
+    """Degree/betweenness records per vertex.
+
+    With ``top`` only the ``top`` highest-betweenness vertices are returned (in
+    that order), so large graphs don't build a record per vertex just to keep
+    the head of the ranking.
+    """
+    n = G.vcount()
+    if n == 0:
         return []
-    deg = dict(G.degree())
-    betw = nx.betweenness_centrality(G)
+    betw = _betweenness(G)
+    nodes = range(n) if top is None else heapq.nlargest(top, range(n), key=betw.__getitem__)
+    deg = G.degree()
     return [
         {
-            "case_number": node,
+            "case_number": G.vs[node]["case_number"],
             "degree": int(deg[node]),
             "betweenness": float(betw[node]),
-            "block": str(G.nodes[node].get("block")),
-            "date": str(G.nodes[node].get("date").date()),
-            "description": str(G.nodes[node].get("description")),
+            "block": str(G.vs[node]["block"]),
+            "date": str(G.vs[node]["date"].date()),
+            "description": str(G.vs[node]["description"]),
         }
-        for node in G.nodes
+        for node in nodes
     ]
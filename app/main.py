@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from string import Template
 
@@ -19,16 +20,21 @@ from .analysis import (
     build_spatiotemporal_graph,
     component_summary,
     centrality,
+    project_coords,
+    type_index,
 )
 
 
 CSV_PATH = os.getenv("CRIME_CSV_PATH", "data/Crimes_-_2001_to_Present_20251124.csv")
 CRIME_TYPE_DEFAULT = os.getenv("CRIME_TYPE_DEFAULT", "ROBBERY")
+# Arrow IPC copy of the loaded frame published by `python -m app.prime`.
+SHARED_PATH = os.getenv("CRIME_SHARED_PATH", "/dev/shm/crimes.arrow")
 
 app = FastAPI(
     title="Chicago Public Safety Network Analysis",
     description="Offline-friendly EDA + SNA web API.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Optional: enable CORS for public frontends
@@ -41,31 +47,22 @@ app.add_middleware(
 )
 
 
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
 @lru_cache(maxsize=1)
 def _load_and_cache() -> Dict[str, Any]:
     cfg = Config()
-    df = load_data(CSV_PATH)
+    df = load_data(CSV_PATH, shared_path=SHARED_PATH)
     summary = overall_summary(df)
     temporal = temporal_profiles(df)
 
-    # DBSCAN hotspots (default crime type)
-    _, hotspots = dbscan_hotspots(df, CRIME_TYPE_DEFAULT, cfg)
-
-    # Spatiotemporal SNA (default crime type)
-    G = build_spatiotemporal_graph(df, CRIME_TYPE_DEFAULT, cfg)
-    components = component_summary(G)
-    cent = centrality(G)
-    cent_top = sorted(cent, key=lambda r: r["betweenness"], reverse=True)[:15]
-
     return {
         "df": df,
         "cfg": cfg,
+        "type_index": type_index(df),
         "summary": summary,
         "temporal": temporal,
-        "hotspots": hotspots,
-        "graph": G,
-        "components": components,
-        "centrality_top": cent_top,
     }
 
 
@@ -76,6 +73,47 @@ def _require_data():
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@lru_cache(maxsize=1)
+def _coords_for(crime_type: str) -> np.ndarray:
+    """Projected coordinates of the last crime type, shared by its hotspots and graph builds."""
+    data = _require_data()
+    return project_coords(data["df"], data["type_index"].get(crime_type, _NO_ROWS))
+
+
+@lru_cache(maxsize=32)
+def _hotspots_for(crime_type: str) -> pd.DataFrame:
+    """DBSCAN cluster table for one crime type (memoized per type)."""
+    data = _require_data()
+    idx = data["type_index"].get(crime_type, _NO_ROWS)
+    _, clusters = dbscan_hotspots(data["df"], idx, data["cfg"], xy=_coords_for(crime_type))
+    return clusters
+
+
+@lru_cache(maxsize=32)
+def _network_for(crime_type: str) -> Tuple[int, int, List[Dict], List[Dict]]:
+    """Node/edge counts, component summary and top-15 centrality for one crime type.
+
+    Only the summaries are memoized; the graph itself is freed once they are computed.
+    """
+    data = _require_data()
+    idx = data["type_index"].get(crime_type, _NO_ROWS)
+    G = build_spatiotemporal_graph(data["df"], idx, data["cfg"], xy=_coords_for(crime_type))
+    return G.vcount(), G.ecount(), component_summary(G), centrality(G, top=15)
+
+
+def _clear_caches() -> None:
+    """Drop the loaded dataset together with every result derived from it.
+
+    The per-type caches are keyed on crime_type alone, so they must never
+    outlive the dataset they were computed from.
+    """
+    _load_and_cache.cache_clear()
+    _coords_for.cache_clear()
+    _hotspots_for.cache_clear()
+    _network_for.cache_clear()
+    _render_home.cache_clear()
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
@@ -89,65 +127,24 @@ def api_summary():
 
 @app.get("/api/hotspots")
 def api_hotspots(crime_type: str = CRIME_TYPE_DEFAULT):
-    data = _require_data()
-    df: pd.DataFrame = data["df"]
-    subset, clusters = dbscan_hotspots(df, crime_type, data["cfg"])
-    clusters = clusters.to_dict(orient="records")
+    clusters = _hotspots_for(crime_type).to_dict(orient="records")
     return {"crime_type": crime_type, "cluster_count": len(clusters), "clusters": clusters}
 
 
 @app.get("/api/network")
 def api_network(crime_type: str = CRIME_TYPE_DEFAULT):
-    data = _require_data()
-    df: pd.DataFrame = data["df"]
-    cfg = data["cfg"]
-
-    G = build_spatiotemporal_graph(df, crime_type, cfg)
-    comps = component_summary(G)
-    cent = centrality(G)
-    cent_top = sorted(cent, key=lambda r: r["betweenness"], reverse=True)[:15]
+    nodes, edges, comps, cent_top = _network_for(crime_type)
     return {
         "crime_type": crime_type,
-        "nodes": G.number_of_nodes(),
-        "edges": G.number_of_edges(),
-        "avg_degree": 0 if G.number_of_nodes() == 0 else 2 * G.number_of_edges() / G.number_of_nodes(),
+        "nodes": nodes,
+        "edges": edges,
+        "avg_degree": 0 if nodes == 0 else 2 * edges / nodes,
         "components": comps[:10],
         "centrality_top": cent_top,
     }
 
 
-@app.get("/", response_class=HTMLResponse)
-def home():
-    data = _require_data()
-    summary = data["summary"]
-    temporal = data["temporal"]
-    hotspots = data["hotspots"].head(5).to_dict(orient="records") if not data["hotspots"].empty else []
-    comps = data["components"][:5]
-    cent = data["centrality_top"]
-
-    def bulletize(items):
-        return "".join(f"<li>{item}</li>" for item in items)
-
-    hotspots_html = bulletize(
-        [
-            f"Cluster {h['cluster']}: size {h['size']} ({h['date_min']} to {h['date_max']}) @ ({h['lat_center']:.5f}, {h['lon_center']:.5f})"
-            for h in hotspots
-        ]
-    )
-    comps_html = bulletize(
-        [
-            f"Size {c['size']} | {c['date_min']} to {c['date_max']} | arrest rate {c['arrest_rate']:.3f} | center ({c['lat_center']:.5f}, {c['lon_center']:.5f})"
-            for c in comps
-        ]
-    )
-    cent_html = bulletize(
-        [
-            f"{n['case_number']} deg {n['degree']} betw {n['betweenness']:.3f} | {n['date']} | {n['block']}"
-            for n in cent
-        ]
-    )
-
-    html_template = Template("""
+_HOME_TEMPLATE = Template("""
     <html>
     <head>
         <title>Chicago Public Safety Network Analysis</title>
@@ -280,7 +277,41 @@ def home():
     </html>
     """)
 
-    html = html_template.safe_substitute(
+
+@lru_cache(maxsize=1)
+def _render_home(cache_key: int) -> str:
+    """Dashboard HTML; ``cache_key`` is id() of the current _load_and_cache() dict."""
+    data = _require_data()
+    summary = data["summary"]
+    temporal = data["temporal"]
+    hotspots = _hotspots_for(CRIME_TYPE_DEFAULT)
+    hotspots = hotspots.head(5).to_dict(orient="records") if not hotspots.empty else []
+    _, _, comps, cent = _network_for(CRIME_TYPE_DEFAULT)
+    comps = comps[:5]
+
+    def bulletize(items):
+        return "".join(f"<li>{item}</li>" for item in items)
+
+    hotspots_html = bulletize(
+        [
+            f"Cluster {h['cluster']}: size {h['size']} ({h['date_min']} to {h['date_max']}) @ ({h['lat_center']:.5f}, {h['lon_center']:.5f})"
+            for h in hotspots
+        ]
+    )
+    comps_html = bulletize(
+        [
+            f"Size {c['size']} | {c['date_min']} to {c['date_max']} | arrest rate {c['arrest_rate']:.3f} | center ({c['lat_center']:.5f}, {c['lon_center']:.5f})"
+            for c in comps
+        ]
+    )
+    cent_html = bulletize(
+        [
+            f"{n['case_number']} deg {n['degree']} betw {n['betweenness']:.3f} | {n['date']} | {n['block']}"
+            for n in cent
+        ]
+    )
+
+    return _HOME_TEMPLATE.safe_substitute(
         rows=f"{summary['rows']:,}",
         unique_types=summary["unique_primary_types"],
         date_min=summary["date_min"],
@@ -294,4 +325,8 @@ def home():
         components=comps_html,
         centrality=cent_html,
     )
-    return HTMLResponse(content=html)
+
+
+@app.get("/", response_class=HTMLResponse)
+def home():
+    return HTMLResponse(content=_render_home(id(_require_data())))
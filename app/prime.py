@@ -0,0 +1,33 @@
+"""
+One-shot loader for multi-worker deployments.
+
+Parses the CSV once and publishes the frame as an Arrow IPC file at
+CRIME_SHARED_PATH (default /dev/shm/crimes.arrow). Each uvicorn worker then
+memory-maps that file instead of loading its own copy:
+
+    python -m app.prime; uvicorn app.main:app --workers 4
+
+With a single worker there is nothing to share, so skip it. Failures are
+reported and ignored: the exit status is always 0, and workers fall back to
+loading the data themselves on the first request.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from .analysis import export_shared, load_data
+from .main import CSV_PATH, SHARED_PATH
+
+
+def main() -> int:
+    try:
+        export_shared(load_data(CSV_PATH), CSV_PATH, SHARED_PATH)
+    except Exception as exc:
+        # Missing or malformed CSV, no room in /dev/shm, ...: workers load on their own.
+        print(f"Shared frame not published to {SHARED_PATH}: {exc}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())